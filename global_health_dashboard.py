@@ -6,15 +6,31 @@ Assessment 3 - Data Analytics and Visualisation
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import json
+from urllib.parse import quote
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from pandas.io.json import ujson_loads as json_loads
+    except ImportError:
+        json_loads = json.loads
 
 st.set_page_config(page_title="Global Health Explorer", page_icon="🌍", layout="wide", initial_sidebar_state="expanded")
 
+# Only printable ASCII is ever rendered in these fonts, so request just those glyphs
+font_glyphs = quote(''.join(map(chr, range(32, 127))))
+st.markdown('<link rel="preconnect" href="https://fonts.googleapis.com">'
+    '<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>'
+    f'<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;700&family=Space+Mono&display=swap&text={font_glyphs}">',
+    unsafe_allow_html=True)
+
 st.markdown("""
 <style>
-    @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;700&family=Space+Mono&display=swap');
     .main { background: linear-gradient(135deg, #0f0f23 0%, #1a1a2e 50%, #16213e 100%); }
     .stApp { background: linear-gradient(135deg, #0f0f23 0%, #1a1a2e 50%, #16213e 100%); }
     h1, h2, h3 { font-family: 'DM Sans', sans-serif !important; color: #e8e8e8 !important; }
@@ -32,67 +48,95 @@ st.markdown("""
 
 @st.cache_data
 def load_data():
-    return json.loads('''{"countries": ["Afghanistan", "Albania", "Algeria", "Angola", "Antigua and Barbuda", "Argentina", "Armenia", "Australia", "Austria", "Azerbaijan", "Bahamas", "Bangladesh", "Barbados", "Belarus", "Belgium", "Belize", "Benin", "Bosnia and Herzegovina", "Botswana", "Brazil", "Bulgaria", "Burkina Faso", "Cambodia", "Cameroon", "Canada", "Cape Verde", "Central African Republic", "Chad", "Chile", "China", "Colombia", "Congo", "Costa Rica", "Cote d'Ivoire", "Croatia", "Cuba", "Cyprus", "Czechia", "Denmark", "Djibouti", "Dominican Republic", "Ecuador", "Egypt", "El Salvador", "Estonia", "Eswatini", "Ethiopia", "Fiji", "Finland", "France", "Gabon", "Gambia", "Georgia", "Germany", "Ghana", "Greece", "Grenada", "Guatemala", "Guinea", "Guinea-Bissau", "Guyana", "Haiti", "Honduras", "Hungary", "Iceland", "India", "Indonesia", "Iran", "Iraq", "Ireland", "Israel", "Italy", "Jamaica", "Japan", "Jordan", "Kazakhstan", "Kenya", "Kiribati", "Kuwait", "Laos", "Latvia", "Lebanon", "Lesotho", "Liberia", "Lithuania", "Luxembourg", "Madagascar", "Malawi", "Malaysia", "Maldives", "Mali", "Malta", "Mauritania", "Mauritius", "Mexico", "Moldova", "Mongolia", "Montenegro", "Morocco", "Mozambique", "Myanmar", "Namibia", "Nepal", "Netherlands", "New Zealand", "Nicaragua", "Niger", "Nigeria", "North Korea", "Norway", "Oman", "Pakistan", "Panama", "Paraguay", "Peru", "Philippines", "Poland", "Portugal", "Romania", "Russia", "Rwanda", "Saint Lucia", "Samoa", "Sao Tome and Principe", "Saudi Arabia", "Senegal", "Serbia", "Sierra Leone", "Slovakia", "Slovenia", "Solomon Islands", "South Africa", "South Korea", "Spain", "Sri Lanka", "Sudan", "Suriname", "Sweden", "Switzerland", "Tajikistan", "Tanzania", "Thailand", "Togo", "Trinidad and Tobago", "Tunisia", "Turkey", "Uganda", "Ukraine", "United Arab Emirates", "United Kingdom", "United States", "Uruguay", "Uzbekistan", "Vanuatu", "Venezuela", "Vietnam", "Yemen", "Zambia", "Zimbabwe"], "clusters": [1, 2, 3, 1, 0, 0, 2, 0, 0, 2, 0, 1, 0, 0, 0, 3, 1, 2, 1, 2, 0, 1, 1, 1, 0, 3, 1, 1, 2, 2, 3, 1, 0, 1, 0, 2, 0, 0, 0, 1, 3, 3, 2, 3, 0, 1, 1, 3, 0, 0, 1, 1, 2, 0, 1, 0, 3, 3, 1, 1, 3, 1, 3, 0, 0, 3, 3, 2, 3, 0, 0, 0, 3, 0, 3, 2, 1, 1, 2, 1, 0, 2, 1, 1, 0, 0, 1, 1, 3, 2, 1, 0, 1, 2, 3, 2, 3, 0, 2, 1, 3, 1, 1, 0, 0, 3, 1, 1, 3, 0, 2, 1, 3, 3, 3, 3, 0, 0, 2, 2, 1, 0, 3, 1, 2, 1, 2, 1, 0, 0, 1, 3, 2, 0, 3, 1, 3, 0, 0, 3, 1, 3, 1, 2, 2, 2, 1, 2, 2, 0, 0, 0, 2, 3, 3, 3, 1, 1, 1], "cluster_labels": {"0": "Developed Nations", "1": "Least Developed", "2": "Emerging Economies", "3": "Developing Nations"}, "embeddings": {"PCA": {"x": [-27.62059498500014, 10.592739719297192, 0.7530477536610813, -27.277031317288646, 11.139114274604214, 11.780717588688223, 8.884676133961023, 20.61824261045703, 26.581071620861323, 0.8526259685364466, 12.971437027521569, -15.711891094500837, 12.637197128001382, 17.329935053008587, 24.029811764996087, 4.603507144149514, -24.703134015578176, 11.606063157573889, -10.698407239926315, 4.742834289112511, 15.013473102980859, -23.692360558865413, -18.79438790604409, -23.37610039870474, 21.421180141693068, -3.973365955661046, -33.388554100008164, -32.52655440153201, 11.593044382105614, 4.46870122859857, 3.511466324910815, -21.470217647607843, 10.095173002826986, -19.801847849310494, 17.530638623963863, 12.168325187182866, 18.085676606590468, 20.038353506372953, 25.947255718743254, -18.2837216031018, -2.1161089800963233, 1.862300474743997, -0.45155649469268744, -0.5479060249710485, 19.533354184578002, -16.873797822515698, -27.512211452930032, -2.152426191938838, 25.43032542119126, 23.61259055137114, -14.398867692897548, -19.512779496940425, 7.410397819612435, 25.221372108482964, -20.529686643127206, 23.823017009402648, 6.21563558731997, -6.421762795821559, -29.51995011405012, -29.510342577860147, -4.40087564194708, -21.066201499004233, -4.316334489723396, 18.394614735281934, 25.747987483089837, -13.259491831889507, -10.645160516806186, 4.501417947461427, -4.528669313798799, 22.115414374154327, 19.06645954864844, 25.160213709340493, 5.373711683690199, 20.43842778384314, 3.716429162527908, 8.211212563827438, -19.22553626102991, -11.932003773146347, 9.869745907583702, -18.200781962447607, 17.221088898067297, 9.457526335362358, -27.32278651375513, -28.934035501168403, 17.153706119007044, 29.15594825756331, -22.951373584487023, -25.079975130560374, 5.607847919722412, 3.715149059620884, -27.263345989469904, 18.63944603631204, -19.827577283251774, 6.806764367539895, 4.0115869483262285, 7.021353221449184, -7.077541050047166, 17.967411774611538, -2.683900504400288, -31.100569113016302, -15.113856990789067, -15.241189953601431, -15.909977182061365, 24.519828282991856, 20.630562420837517, -5.924490306519279, -29.170130683353115, -30.298011047593352, -1.93094822093819, 26.16004755593092, 3.890480410963164, -17.344867625677196, 3.033887839464339, -0.5927797653598819, -1.82901635038112, -7.637895223999596, 16.85270615022945, 22.461719474806987, 12.78851227481497, 12.536256690907003, -22.506506484066552, 7.559859760503994, 2.163564565586006, -12.710140147448158, 4.934978020488776, -16.57636907278143, 14.013714830383208, -36.52011214494155, 15.824198217264263, 19.70691058401421, -10.93254375496832, -7.115607481870984, 14.740830217071624, 22.465666463783535, 1.3460108261986763, -13.223024685143479, 0.6194716164675174, 25.424435977442116, 26.83951156042771, -6.445686148073517, -22.269050949121517, 4.986813549986175, -20.246730073259467, 4.995813995069986, 3.688242905495516, 9.757657914525181, -22.30417406388764, 12.300123423011458, 8.057548323262841, 21.27555120067762, 20.119126917243857, 11.344118353659324, 2.6701394362113624, -6.991473669524833, 1.2762926761074913, -4.915911202092605, -16.795674301763356, -22.206632586140028, -17.008823053683624], "y": [1.0518950065476855, -14.082909514803582, -9.90760127777017, 9.523920596793756, 4.140028476833624, 1.756724220781214, -13.687966622657717, 9.836138568141129, 11.984692058047115, -11.340516666157606, 2.188688453235155, -12.555077876690794, 5.136856724394625, -1.640074391475225, 10.561352997968203, -1.760969312576198, 7.13630980404316, -13.72457396901553, 3.4097431559147466, -4.507842734080502, -0.1230064217867763, 4.131735302857847, -9.60300676639047, 7.532292395015406, 9.841925331818937, -5.815099773467165, 17.600837733834908, 14.297638673222796, -5.8565451486346145, -21.83913078774354, -3.746200712117958, 8.374987230987067, -2.442023253574878, 6.38191555031735, 0.2047682703659039, -4.435807361298372, 0.03748675638439255, 4.159099041212914, 15.18331747990225, -2.734283761690602, -0.6944711754964888, -1.969930973914863, -17.081246888250416, -8.917741172365792, -0.09999606567074308, 4.127822502998028, 2.132696894586804, -1.0223310116506652, 10.662215487108195, 12.035710257947752, 7.116025455526758, 3.4219130293014866, -6.505228767593461, 13.603361712843233, 3.7482298411459256, 2.9490409231114563, 4.8595609378825495, -6.621435928749484, 6.864374548545713, 6.674021392256512, -7.687209286677383, 4.39441245446063, -5.936796243959106, 3.6518426769871577, 10.70574310046184, -9.69677095818597, -10.441093941456554, -14.386245044138226, -5.634316743249109, 8.649006351795379, -0.10669154005310347, 5.23856112479933, -0.3610854600345723, 4.637485514335833, -7.894201929256617, -7.416215659074494, 2.90626663952077, 3.3055710237318965, -7.51936404262476, -10.063991475177168, -0.8511307344257167, -7.895089954600178, 5.672329321162147, 8.803862734125916, -2.881939018741318, 15.494956740750295, 3.377969085507785, 0.5587919083842785, -4.697418957287899, -11.654807828821689, 4.4083155815454775, 2.1670258270720644, 4.694872132684773, -5.795799517757265, -6.248106630379408, -3.724431618325247, -2.6090918070099165, -4.185013972087475, -14.735123110462101, 7.7196771184573505, -8.31076763611431, 3.471920526142581, -8.988535065797459, 12.379170605129993, 8.095736319119876, -6.698546799862351, 3.0344154991975247, 12.317431015398812, -5.918351325928815, 11.90547398049662, -11.725398420696205, -1.2286476764616119, 0.18152944830801432, -0.21507114049105527, -7.303726595225378, -4.11337023900471, -2.9043250767752897, 3.385172672701959, -5.043687141387878, -2.8145974205528486, 2.3576532676408606, 7.8162878170037695, 2.5199720938726764, 1.644005439217888, -10.946813192444635, 0.5624888165450932, -2.3571816798321845, 13.317938067458602, 1.3823057630827833, 0.5657612698266019, 1.460400813087078, -0.6219292384210928, -12.332896363478264, 6.770663307671383, -9.018639102295174, 5.323907128387986, -3.467662758449734, 14.139994855662966, 15.456946100934315, -4.552450726350122, 3.858039023255995, -10.299712139675284, 3.707147474753767, -2.5685762418419635, -9.620381889292167, -12.526441945559169, 7.997974364917633, -1.3081416436407685, -1.643533409983117, 11.164308216097748, 12.494175781613082, 1.8068053938979265, -8.09135327023081, 3.6048332232576477, -0.7838813231921243, -14.600438318115671, -3.713327704447787, 3.3220059894696865, 3.756858873148447]}, "t-SNE": {"x": [-9.67988109588623, 5.4624552726745605, 2.7071118354797363, -10.518755912780762, 2.1211225986480713, 4.388515472412109, 6.113856315612793, 6.909683704376221, 8.198691368103027, 4.303776264190674, 2.405430316925049, -4.978764057159424, 3.0162453651428223, 9.70377254486084, 7.571288585662842, 2.439969062805176, -10.0107421875, 7.049246311187744, -6.043187618255615, 0.7274525165557861, 7.330296039581299, -10.175712585449219, -5.845556259155273, -9.702593803405762, 6.5770745277404785, -1.0154986381530762, -11.388908386230469, -11.64315128326416, 3.7429420948028564, -2.4309847354888916, 1.1314971446990967, -8.760289192199707, 1.9087198972702026, -9.520356178283691, 6.630642414093018, 4.364389896392822, 5.186572074890137, 7.579051971435547, 8.626544952392578, -6.6003737449646, -1.535014033317566, -0.3546498417854309, 3.6040494441986084, 0.28515899181365967, 10.080961227416992, -5.640725135803223, -11.881325721740723, -1.2669711112976074, 8.866846084594727, 7.244828224182129, -10.431732177734375, -9.03288745880127, 6.71968936920166, 8.055903434753418, -11.42518138885498, 6.265057563781738, 1.9876571893692017, -0.024391811341047287, -12.742690086364746, -11.241476058959961, -1.9001491069793701, -8.799617767333984, -0.20997636020183563, 7.451107978820801, 9.152716636657715, -4.112751007080078, -4.344799041748047, 3.715946674346924, -7.122235298156738, 9.143573760986328, 5.6609673500061035, 6.528146266937256, 1.7896009683609009, 8.061214447021484, 2.9229512214660645, 8.587662696838379, -7.880163669586182, -4.916762828826904, 0.7943767309188843, -4.939217567443848, 9.450380325317383, 5.348816871643066, -5.927152156829834, -10.962194442749023, 9.466867446899414, 8.986863136291504, -8.91049575805664, -9.426562309265137, 0.2777436673641205, -1.498258113861084, -10.646474838256836, 4.961763381958008, -9.58142375946045, 0.7457888126373291, 0.537207841873169, 5.97318172454834, -3.7233476638793945, 6.059213161468506, 2.3040130138397217, -10.38583755493164, -4.226349353790283, -6.222041130065918, -5.3153486251831055, 7.589687824249268, 6.867583274841309, -1.4374369382858276, -10.950688362121582, -12.475069046020508, -3.239898443222046, 8.86466121673584, 3.5974314212799072, -8.501524925231934, -0.038365527987480164, 0.0028893945273011923, -0.865388035774231, -3.495652437210083, 8.657885551452637, 7.1343183517456055, 6.865504264831543, 7.945276737213135, -9.77231216430664, 1.9538136720657349, -3.5437402725219727, -7.528247833251953, 3.7672922611236572, -8.643393516540527, 6.522366523742676, -12.535285949707031, 7.128486633300781, 6.839870452880859, -4.567132949829102, -5.104387283325195, 0.105309396982193, 6.868306636810303, -0.5229949951171875, -8.246920585632324, 0.11063770204782486, 8.09581184387207, 7.588316440582275, 3.6686859130859375, -8.0194730758667, -0.3811088800430298, -9.004297256469727, 1.0554604530334473, 3.291017770767212, 4.20741605758667, -8.918935775756836, 8.430068969726562, 4.5562424659729, 7.596989631652832, 6.522058486938477, 4.471418380737305, 4.126112461090088, -4.435854434967041, 0.8103766441345215, -2.870682716369629, -8.6251802444458, -7.788021564483643, -7.36338472366333], "y": [-0.45364534854888916, 0.990699291229248, 3.1035451889038086, 3.710733413696289, -4.271355628967285, -2.324322462081909, 1.1944996118545532, -5.813818454742432, -5.319468975067139, 1.5363081693649292, -2.2434656620025635, 3.9916985034942627, -3.137848138809204, -0.7917569875717163, -5.117668151855469, -0.9324330687522888, 2.5311779975891113, 0.7781851291656494, 0.20864497125148773, 0.3623840808868408, -1.5443589687347412, 1.7205675840377808, 4.60011100769043, 2.3334784507751465, -6.177953720092773, 1.4777497053146362, 3.780505657196045, 2.6260993480682373, -1.6623722314834595, 4.96299409866333, 1.0175200700759888, 3.208794355392456, 0.039859838783741, 2.2011091709136963, -2.6205692291259766, -1.1453258991241455, -3.5102741718292236, -2.779470205307007, -6.417612552642822, 3.116487741470337, -0.24200491607189178, 0.09535261243581772, 3.368487596511841, 1.863472819328308, -2.3322198390960693, 1.0567744970321655, 0.9693217873573303, -2.977259874343872, -6.123186111450195, -5.46856689453125, 0.41321897506713867, 1.1983261108398438, -0.2274896502494812, -5.588030815124512, -0.4533480405807495, -4.299988746643066, -3.534101963043213, 1.8250315189361572, 2.8463821411132812, 2.9347496032714844, 2.6990654468536377, 2.1296160221099854, 1.6736479997634888, -2.409430503845215, -6.927262306213379, 5.106509208679199, 3.488271713256836, 3.0639021396636963, -2.5033082962036133, -5.736675262451172, -4.435032844543457, -4.622937202453613, -1.13486647605896, -4.216457366943359, 2.437913179397583, 0.7392550110816956, 1.8612059354782104, -1.807573676109314, -2.3531689643859863, 4.385881423950195, -1.7020686864852905, 3.212528705596924, 1.6810916662216187, 2.8339056968688965, -1.8493034839630127, -7.80881929397583, 2.326349973678589, 3.4049072265625, -1.0785151720046997, -1.4192999601364136, 1.781912088394165, -5.84641695022583, 0.9697156548500061, -1.3924064636230469, 1.2611360549926758, -0.14389429986476898, -0.72109454870224, -1.7570300102233887, 3.682558298110962, 3.410888910293579, 3.808612108230591, 0.6838122606277466, 3.936910629272461, -6.780250072479248, -5.781815528869629, 1.4483013153076172, 1.6366026401519775, 2.8753700256347656, 0.8738707900047302, -6.920998573303223, 5.102436542510986, 0.37116482853889465, -0.05237651243805885, 0.5137942433357239, 0.22902239859104156, 0.8426285982131958, -1.8203078508377075, -3.833420753479004, -0.9141155481338501, -0.8395197987556458, 5.257037162780762, -3.5181171894073486, -2.552685499191284, 0.7488463521003723, 4.759139060974121, 1.251807689666748, -1.6630749702453613, 3.210394859313965, -2.340106964111328, -2.993985891342163, -2.1102640628814697, 0.9868399500846863, -2.688269853591919, -4.4444451332092285, -0.7267236113548279, -0.7459561824798584, -0.36731019616127014, -6.275981903076172, -6.83903169631958, 1.3351956605911255, 3.376774311065674, -1.336354374885559, 2.0921177864074707, -0.7576907277107239, 2.922398805618286, 2.9951536655426025, 4.52386474609375, -0.6018149852752686, 4.947514057159424, -6.020571231842041, -7.087860107421875, -2.3132224082946777, 1.4596134424209595, -2.1203813552856445, -0.15367721021175385, 3.803307294845581, 0.00926810223609209, 2.061187505722046, 1.7416353225708008]}, "UMAP": {"x": [10.655437469482422, 14.549939155578613, 13.822370529174805, 10.037797927856445, 15.211077690124512, 15.19454574584961, 14.501176834106445, 16.70286750793457, 16.724342346191406, 13.843202590942383, 15.005085945129395, 12.208720207214355, 14.875523567199707, 15.88690185546875, 17.005306243896484, 14.471909523010254, 10.275508880615234, 14.912670135498047, 11.808300018310547, 13.969929695129395, 15.331063270568848, 10.64107894897461, 11.835082054138184, 10.705866813659668, 16.88251304626465, 13.417655944824219, 10.127190589904785, 10.325227737426758, 14.476046562194824, 13.117525100708008, 14.030985832214355, 10.556568145751953, 14.226700782775879, 10.434857368469238, 15.56215763092041, 14.942874908447266, 16.108808517456055, 15.925745010375977, 16.915298461914062, 11.404823303222656, 14.29812240600586, 13.866141319274902, 13.759428024291992, 13.913219451904297, 15.684330940246582, 11.327569007873535, 10.70733642578125, 13.197166442871094, 16.58234214782715, 17.011213302612305, 10.805240631103516, 10.786415100097656, 15.065553665161133, 16.851411819458008, 10.62740707397461, 16.402164459228516, 14.82429027557373, 13.574722290039062, 10.259232521057129, 10.130229949951172, 13.26913070678711, 11.021690368652344, 13.885055541992188, 15.582056999206543, 17.3668155670166, 11.861802101135254, 12.646842956542969, 13.959601402282715, 13.365913391113281, 17.099979400634766, 16.269458770751953, 16.679792404174805, 14.457549095153809, 16.986591339111328, 14.0293607711792, 14.829174041748047, 11.310229301452637, 12.64921760559082, 13.969573974609375, 12.148478507995605, 15.26097583770752, 14.788588523864746, 11.452226638793945, 9.991257667541504, 15.478204727172852, 17.019489288330078, 10.747771263122559, 10.524097442626953, 14.270413398742676, 13.819477081298828, 10.522026062011719, 16.33967399597168, 11.047653198242188, 14.522296905517578, 14.196422576904297, 14.873000144958496, 12.519429206848145, 15.770417213439941, 13.58236312866211, 9.953669548034668, 11.977341651916504, 11.582103729248047, 11.603802680969238, 17.06718635559082, 16.439167022705078, 13.681349754333496, 10.488292694091797, 9.897305488586426, 13.535722732543945, 17.23526954650879, 13.859681129455566, 11.437969207763672, 14.078566551208496, 14.032674789428711, 13.053075790405273, 12.64281940460205, 15.559433937072754, 16.144359588623047, 15.047208786010742, 15.005959510803223, 10.049352645874023, 14.913812637329102, 14.345141410827637, 12.115551948547363, 13.781816482543945, 11.565917015075684, 15.327291488647461, 10.026145935058594, 15.608996391296387, 15.894750595092773, 12.490812301635742, 12.324395179748535, 14.667372703552246, 16.509061813354492, 13.323203086853027, 11.336321830749512, 13.553933143615723, 17.194530487060547, 17.217233657836914, 12.877291679382324, 10.687426567077637, 13.551338195800781, 11.065788269042969, 14.609249114990234, 14.20024299621582, 14.233166694641113, 10.28322982788086, 15.264785766601562, 14.200642585754395, 16.82608985900879, 16.72031021118164, 15.478137969970703, 13.898192405700684, 12.73516845703125, 14.384488105773926, 12.700531959533691, 11.200551986694336, 11.029009819030762, 11.495819091796875], "y": [7.167675495147705, 9.700594902038574, 9.316701889038086, 7.396548271179199, 8.270254135131836, 9.000909805297852, 9.994498252868652, 10.311406135559082, 10.56619644165039, 9.788500785827637, 8.408544540405273, 7.972686767578125, 8.425108909606934, 10.490372657775879, 10.545048713684082, 8.35811710357666, 7.524231910705566, 9.68073844909668, 6.9899091720581055, 8.422271728515625, 10.066020965576172, 7.258409023284912, 7.801445960998535, 7.335909843444824, 10.155837059020996, 7.807399272918701, 7.257989883422852, 6.816365718841553, 9.087886810302734, 8.556253433227539, 7.926229000091553, 7.911579132080078, 8.104432106018066, 7.697281837463379, 9.720144271850586, 8.896700859069824, 9.558382034301758, 10.319340705871582, 10.737427711486816, 7.342557907104492, 7.755701065063477, 7.949395656585693, 9.189764976501465, 7.924833297729492, 10.477693557739258, 7.017576217651367, 6.8898024559021, 7.539536952972412, 10.76083755493164, 10.245771408081055, 7.7323431968688965, 7.388307571411133, 9.96532917022705, 10.510735511779785, 7.994343280792236, 9.83193588256836, 8.048295021057129, 7.6318817138671875, 7.246191501617432, 6.923069000244141, 8.07529067993164, 7.7061591148376465, 7.453764915466309, 10.223742485046387, 10.553001403808594, 8.210755348205566, 8.060773849487305, 9.37725830078125, 9.195928573608398, 10.839359283447266, 9.876228332519531, 9.969002723693848, 7.961042404174805, 10.038928985595703, 8.991753578186035, 10.316378593444824, 7.839395999908447, 7.30182409286499, 8.697090148925781, 7.989888668060303, 10.511591911315918, 9.222550392150879, 7.218808174133301, 7.085202693939209, 10.261109352111816, 10.847057342529297, 8.131020545959473, 7.608409404754639, 8.56185531616211, 8.409493446350098, 6.860629558563232, 9.579874038696289, 7.328876495361328, 8.50213623046875, 8.391047477722168, 10.011602401733398, 8.545659065246582, 9.671030044555664, 9.505812644958496, 7.372384548187256, 7.844209671020508, 7.197409629821777, 8.056913375854492, 10.56274127960205, 10.227692604064941, 7.695715427398682, 6.929272651672363, 7.028224468231201, 8.319409370422363, 10.67122745513916, 9.019155502319336, 7.768220901489258, 8.178865432739258, 7.528285503387451, 8.14410400390625, 7.647336483001709, 10.119314193725586, 10.141056060791016, 9.804526329040527, 10.364627838134766, 7.658178806304932, 7.996026992797852, 7.3937087059021, 7.478989601135254, 8.928018569946289, 7.5925421714782715, 9.696221351623535, 6.929698467254639, 9.818723678588867, 9.93691349029541, 7.182375907897949, 7.013636589050293, 9.344264030456543, 9.6867036819458, 8.449728965759277, 7.603745460510254, 8.532115936279297, 10.451976776123047, 10.507917404174805, 9.000316619873047, 7.973283767700195, 8.27249813079834, 7.115428924560547, 8.553519248962402, 9.394181251525879, 9.734992027282715, 7.838733673095703, 10.236018180847168, 9.060099601745605, 10.092352867126465, 10.903433799743652, 9.104228973388672, 9.754983901977539, 7.34915018081665, 7.8158674240112305, 8.112247467041016, 7.926248073577881, 7.830470085144043, 6.886925220489502]}, "Isomap": {"x": [45.94216232903102, -19.56941202847275, 0.7393463181764722, 57.5460204006974, -18.168917590619387, -18.841726296586696, -20.492071644221024, -29.121463530806476, -42.52290591960703, -10.844034592380277, -20.214569782402556, 25.819189634028923, -18.988535131741, -47.897897605126225, -40.92236819298378, -13.615534235789108, 52.28739741404898, -22.297195629030192, 22.168424859754168, -7.811892456015733, -37.34275073915737, 44.978338660446006, 29.814709469862528, 51.49213442812916, -38.18163129006226, 8.314177161326542, 61.440556943713176, 56.048549846554856, -17.043585143111756, -9.436668270164208, -8.484184982019558, 38.74137093210098, -14.31554595488823, 39.687988489267724, -37.540592881753305, -18.86825030724477, -23.31805494634528, -34.06244510996749, -43.500613275397825, 32.41208418175476, 2.7837399210444085, 1.1200440955015618, -1.7271073279337548, 2.7013469878620477, -49.99353531391651, 31.15072545762144, 58.361258622363366, 0.9165836879280003, -42.59173714549118, -39.58349165574358, 28.659866592562658, 35.13672883359583, -19.90705277491069, -41.54141443962176, 32.75229416494201, -41.892762248159784, -10.86275499521962, 8.838649324368806, 57.39848776568479, 54.16291150796794, 4.969063106398895, 43.24003940666182, 7.989153890491791, -35.03233271010065, -42.40553227203592, 24.58076345186994, 18.628714043926728, -11.46094269749847, 12.674317578300192, -41.26215310825811, -36.978206590327254, -41.27634229633349, -9.038514179229358, -41.81756108330005, -6.485779236889249, -21.943120060491317, 34.16945124613444, 23.88990000798776, -15.972527872099183, 29.237523717967637, -41.52702284055489, -17.194386917339394, 48.22837301547504, 52.39476623519782, -41.85950363202142, -52.33563705623568, 45.065941929387655, 44.72496443848647, -7.983772563779147, -12.09499352301449, 50.29926145092118, -33.52594294207241, 38.605324049317474, -11.718539718388866, -4.98286596055237, -15.808230892770998, 6.997063174625645, -40.00801531026082, 5.381998374379323, 57.1851511096046, 24.22299627625168, 30.612525998594723, 30.320843466397573, -41.684782369895125, -29.36174629000275, 11.749014744187578, 52.288215161083784, 59.59771685375111, 4.916457984016135, -44.83991609785874, -14.181246426180511, 33.4355980994825, -0.9798044017434437, 3.906234862383746, 4.0325377741377295, 16.479618378791326, -38.144757366551225, -39.80601639670271, -24.95808476167363, -22.575234339984284, 44.052842394721935, -15.719159908372946, -3.178487014611867, 25.12534126175549, -12.345326239521835, 29.40950454985811, -31.338500208634546, 63.16419739142046, -23.758449318313165, -38.341189891871025, 23.146238540871273, 16.7625306949617, -19.585108604003747, -38.05530080648586, -3.825762938013967, 25.325107202582576, 2.1583465863685953, -41.140491569653626, -42.617406745800196, 9.227190406009735, 38.363762331495565, -6.751643109891518, 35.23414470846237, -9.936760085656555, -11.957967967126896, -25.176064298644494, 40.09830455949056, -25.08190549173632, -19.598030400793814, -38.69418589889988, -42.712530225568024, -19.194293755988546, -9.475034740203519, 19.12048882768196, -6.0718609906632475, 6.200825111241614, 31.188666040026572, 43.64193200328891, 31.843635094707572], "y": [6.506889037078348, 24.096393093744418, 12.82488052884882, -7.046510843368854, -17.137068604593964, -4.034699107812767, 28.464681335517433, -19.581867058744994, -12.711020914877276, 27.004818948311204, -14.564046634925212, 15.26840476772174, -16.78279858945457, 10.61060083943278, -9.460001946228623, -8.198795931296965, -7.547144174467344, 20.58310994988823, -6.239300047371081, 7.61053448614391, 10.78739476299969, -2.8310372891022832, 14.95116339596211, -7.1777103579352985, -15.677239485830212, -2.793616902318048, -7.4001435874637504, -6.03065232986661, 6.623987462566286, 44.02809017821635, -6.128955045036393, -23.99682002427372, -13.535900127561526, -2.7635798333066326, 3.4401217967169075, -1.035382749044903, -15.717263171577645, -2.2755178643979153, -16.407947592623817, 4.302429902784174, -12.772996984098942, -6.471578961259031, 29.136474385982755, -2.3612544283936296, 7.757395160943234, -1.0816350396761742, 0.03796636713370062, -3.701841717245547, -12.55541098361037, -16.981356036022476, -10.26423661648873, 0.15308423903302715, 23.177263254034568, -13.209997705407805, -14.336369290835641, -4.628357162361827, -14.872976244571625, -1.1628979934578878, 0.41364163579739543, 0.20378264407312668, 4.184056371678556, -8.30613446846366, -2.584094474498095, -0.3254970035306104, -19.542817026223233, 17.071121127330965, 12.85893754058194, 19.05354701195482, 20.099452849093673, -14.217851816369334, -2.165835934038958, -6.840844060761733, -7.654575673041818, -8.710145850204967, 6.409148723068893, 23.14018576945417, -6.2951998384515, 2.655164436300153, -1.511374088940871, 12.811132873385297, 7.644411480999316, 2.4246516425496365, 3.5298823372460846, -2.9759232545035315, 9.928449950880637, -24.073510250815776, 3.825512373209423, -5.301328648318969, 1.8559186604832352, 7.117525479665116, 0.4597130126321899, -3.8241057900248894, -9.2022152509371, 9.803479975072067, 2.4694317930099663, 13.988324122703247, 1.187171765568469, 11.060579627651165, 28.381477531152193, -5.107755896774582, 14.179595441894831, -0.11040058433104694, 12.291556492586738, -18.26392048964709, -14.852675831698567, 2.248603856047841, -0.25514130205599506, -8.421778182541308, 9.702312184497488, -18.435454956286115, 12.357273941104385, 5.564817774398993, -7.217800105428085, -8.918203757639589, 7.613376652722343, 1.6059066967706097, 8.978928927194145, -1.9965093297640515, 18.204280485984604, 14.67776179189832, -14.797421886413526, -14.36323697533725, -14.443421355813019, -9.51248231612893, 12.7229486394947, -0.5808919383860924, 10.989764147235704, -3.5702521424949056, -4.460812706419943, 4.209232645061819, -8.704910196580824, 7.061074061978344, 13.190978105251867, -8.794826052365385, 11.51922360633261, -10.741483247591507, 6.872460846214309, -17.504078459791035, -20.741106943147024, 8.749189288880778, -19.375608107802943, 7.016263663286801, -7.999610408561891, 6.280335732344231, 18.59723367170981, 24.043894199097156, -28.016830150046204, 13.216406546591296, -0.3163113723329079, -11.888776825756855, -19.818897570177732, -4.604061296458363, 22.803739805001406, -9.137257695312849, -6.399562570149402, 8.55962026343897, 5.498302511855924, -1.374695488732333, -2.9639076594752543]}, "LLE": {"x": [0.11591812793030769, -0.020436311141123, 0.018600142085601387, 0.10591158908477377, -0.046951079150786765, -0.05769958951543619, -0.013022276399092397, -0.11330702687194799, -0.14659548924060783, 0.011559313402561305, -0.05250261045454896, 0.08211362290888792, -0.06245647003458571, -0.07583440701851656, -0.13410264793049914, -0.014502148129722864, 0.10937841754821993, -0.02330217298062308, 0.037440196576568996, -0.020314669535443988, -0.060765440109021074, 0.10650228049894837, 0.08455024431514545, 0.09995159143485975, -0.11126625804752026, 0.01975401043279941, 0.12972338187200227, 0.13993810627517128, -0.03761713148270252, 0.007695578139832043, -0.009515245658476973, 0.08352843476197769, -0.027411589673647194, 0.08702707455676414, -0.07991378548556674, -0.04181295132613455, -0.07425393600615056, -0.09964002239608549, -0.15218240778721615, 0.07669952675289343, 0.013712122825910764, -0.005991875805789623, 0.0269444210325709, 0.01346842148721238, -0.08405331012728665, 0.06344097453666911, 0.1136862676476412, 0.02798439458077549, -0.1391336431012932, -0.12846652255869906, 0.05506452574851153, 0.09221393927397255, -0.022391608501483848, -0.1435949282910347, 0.08346495851340939, -0.10673081585239008, -0.02381719363511099, 0.03481234079182434, 0.12846417264715976, 0.12792947491888068, 0.03299065803351278, 0.08388776748928396, 0.022320249647050358, -0.09048801330343206, -0.13588196335609498, 0.0647489752372676, 0.059580322184887076, 0.003942557806639865, 0.03458400836418428, -0.11714219172566058, -0.08521802811829957, -0.12366375755941035, -0.019030698362137263, -0.10244974366734108, 0.002331664970831017, -0.02920875850830429, 0.07720254268251234, 0.050249579248442366, -0.025260710159282915, 0.09061791855107396, -0.07344045841322895, -0.027379646969070214, 0.09940957558762026, 0.12422612417142079, -0.07114561445867709, -0.16029720673529216, 0.0981711380596541, 0.1071022578820164, -0.006634816451490125, -0.0033910802589906253, 0.12476479196195707, -0.0731405290442445, 0.08646198334935493, -0.009904424131919037, -0.007687637708261017, -0.022449738837757787, 0.02102267150709601, -0.06738756889013015, 0.028492572501884417, 0.12488953968011712, 0.07373012300085671, 0.05226379556407756, 0.07436080150423001, -0.135770213363706, -0.10823491993903085, 0.03351468544957862, 0.12647340525717649, 0.1321767939966782, 0.014903923478708402, -0.14678174869573893, 0.005024668590869662, 0.07835271937988678, -0.01604168454344423, 0.005685949847504625, 0.015477082812602128, 0.03715002461272357, -0.0705776103321813, -0.10839191244332393, -0.05257756160997181, -0.0548811786451777, 0.08409749011311726, -0.03678391602110316, -0.00442682322184533, 0.05207087791176565, -0.003190850357843493, 0.0789557077568375, -0.0566702056463691, 0.15827284123596203, -0.07176287086658185, -0.09239254037393563, 0.050269288250467614, 0.02314030902945957, -0.03853985704317099, -0.11331747083323042, 0.013241666034532633, 0.05804056343450533, 0.008103788742007928, -0.14687868644168017, -0.15495543157793676, 0.03519876669021459, 0.08832159022042078, -0.0005466932802288028, 0.08852009367508232, -0.01413275922377615, 0.004585034911929993, -0.023477836290366774, 0.08660317253246058, -0.05262409854503493, -0.037143860013871086, -0.12381040372932967, -0.12419864309039455, -0.05368193941447033, 0.0021954758580720324, 0.033485737208676064, -0.0023750109577106576, 0.04109512622800493, 0.07564206743532775, 0.08876101983543362, 0.07076573532742372], "y": [-0.05528965009863293, -0.03304541225578281, 0.022031021521861045, -0.015859480911667355, 0.05872033174762961, 0.02174060479037658, -0.11138728442108409, 0.07741761038257278, -0.025120157395551596, -0.09736752662383805, 0.13573902700039114, -0.0284958810098414, 0.038699311955852585, -0.1919155211529009, -0.02190376917350966, 0.14198991135660122, 0.050205492859763265, -0.11869820332706123, -0.046342117433595224, 0.09869473958779942, -0.1672254682434514, 0.027256701538412552, -0.06251088093476567, -0.003187263217363113, 0.08376955370331718, 0.05495181694785325, -0.06867742516169376, 0.014244983560890549, 0.027290920539658394, -0.08891663783891395, 0.1469814615265841, -0.0425898211734676, 0.1250039536381309, 0.0013202156102227226, -0.10903568462018047, 0.012578223211523326, 0.06210705698292457, -0.12345287489830853, 0.0037062665431435923, -0.030998241964751372, 0.11774385756081154, 0.08632615011933382, 0.036460129280446674, 0.17721924580134063, -0.180106137930784, -0.043983769856369204, -0.007467349886664448, 0.018083941110312304, -0.01984934107925465, 0.020283356277116447, -0.050750297804691626, 0.015680384573282143, -0.14129242478372947, -0.037162197255214274, 0.018738897009439117, 0.00021765784669072665, 0.06045430335366944, 0.17864708559537, 0.010530075958331483, -0.04753781076788083, -0.009458015766638996, 0.02497319098133297, 0.1411953759264011, -0.15571500127970617, 0.09172910056347734, -0.02897744425805742, -0.05927963218059988, 0.05155863802073417, 0.017525022499450683, 0.031949514529881096, 0.06581263490664212, 0.002010049520347508, 0.11775364138646782, -0.009635847571862088, 0.07330041079152921, -0.16249686742593658, 0.026360146828608245, -0.11405794971529783, 0.11807916373116725, -0.07801586886264267, -0.1900601584329194, 0.09388035599395159, -0.05840944230986131, 0.008809286047097, -0.17411383847516848, 0.07239804451659365, -0.021863027352287984, 0.015873542621325305, 0.05144908095133238, 0.05480355616474776, 0.007345269751242806, 0.07206387751877597, 0.008677285684015788, -0.008971544866206365, 0.14825865542838762, -0.11550655983688331, -0.12291106897257967, -0.05779996644748046, -0.007928704848848745, -0.013842292176894637, -0.0665441684343692, -0.06263233538762424, -0.03113240912427926, 0.04149008608442029, 0.04717227538143792, 0.09591558917894878, 0.01691423207128801, 0.016445280032115907, -0.0676558413142464, 0.04690751136127023, 0.07757263394031363, -0.02564621726562949, 0.09627268541802936, 0.11643386048519053, 0.06214987670423104, -0.0036113916360203495, -0.14101863582125126, -0.06587802756230751, -0.13946242972369743, -0.157354079257003, 0.014782603073884418, 0.07427837649293333, 0.005315472152887198, 0.03885010404776176, 0.06340138075243751, 0.021469721497566964, -0.11987127614889681, -0.027303316495083448, -0.10388568640387619, -0.08150107102279827, 0.00024813484850883666, -0.04931556295266979, 0.02195868257436797, 0.005318602157199315, 0.00924531303908837, 0.039791901208773184, 0.03551951564463143, 0.03206451279459906, 0.06639688917811137, -0.05735932889144717, 0.006688351311110036, 0.011637782435986718, 0.04051811128468465, 0.04788075588446625, 0.034563107024088546, 0.0059297622611169665, 0.019116025537107256, -0.15769332071745015, 0.14966126927115142, 0.029100064642578354, 0.08899140193156349, 0.005893677068930872, -0.07652155572934281, -0.018949300602522107, 0.13957500981337734, -0.0415135938015946, 0.008651536911568496, -0.03545471556398417, 0.014753896501761092]}}, "variance_explained": {"PC1": 33.9, "PC2": 7.0}, "indicators": {}, "cluster_averages": {}}''')
+    return json_loads('''{"countries": ["Afghanistan", "Albania", "Algeria", "Angola", "Antigua and Barbuda", "Argentina", "Armenia", "Australia", "Austria", "Azerbaijan", "Bahamas", "Bangladesh", "Barbados", "Belarus", "Belgium", "Belize", "Benin", "Bosnia and Herzegovina", "Botswana", "Brazil", "Bulgaria", "Burkina Faso", "Cambodia", "Cameroon", "Canada", "Cape Verde", "Central African Republic", "Chad", "Chile", "China", "Colombia", "Congo", "Costa Rica", "Cote d'Ivoire", "Croatia", "Cuba", "Cyprus", "Czechia", "Denmark", "Djibouti", "Dominican Republic", "Ecuador", "Egypt", "El Salvador", "Estonia", "Eswatini", "Ethiopia", "Fiji", "Finland", "France", "Gabon", "Gambia", "Georgia", "Germany", "Ghana", "Greece", "Grenada", "Guatemala", "Guinea", "Guinea-Bissau", "Guyana", "Haiti", "Honduras", "Hungary", "Iceland", "India", "Indonesia", "Iran", "Iraq", "Ireland", "Israel", "Italy", "Jamaica", "Japan", "Jordan", "Kazakhstan", "Kenya", "Kiribati", "Kuwait", "Laos", "Latvia", "Lebanon", "Lesotho", "Liberia", "Lithuania", "Luxembourg", "Madagascar", "Malawi", "Malaysia", "Maldives", "Mali", "Malta", "Mauritania", "Mauritius", "Mexico", "Moldova", "Mongolia", "Montenegro", "Morocco", "Mozambique", "Myanmar", "Namibia", "Nepal", "Netherlands", "New Zealand", "Nicaragua", "Niger", "Nigeria", "North Korea", "Norway", "Oman", "Pakistan", "Panama", "Paraguay", "Peru", "Philippines", "Poland", "Portugal", "Romania", "Russia", "Rwanda", "Saint Lucia", "Samoa", "Sao Tome and Principe", "Saudi Arabia", "Senegal", "Serbia", "Sierra Leone", "Slovakia", "Slovenia", "Solomon Islands", "South Africa", "South Korea", "Spain", "Sri Lanka", "Sudan", "Suriname", "Sweden", "Switzerland", "Tajikistan", "Tanzania", "Thailand", "Togo", "Trinidad and Tobago", "Tunisia", "Turkey", "Uganda", "Ukraine", "United Arab Emirates", "United Kingdom", "United States", "Uruguay", "Uzbekistan", "Vanuatu", "Venezuela", "Vietnam", "Yemen", "Zambia", "Zimbabwe"], "clusters": [1, 2, 3, 1, 0, 0, 2, 0, 0, 2, 0, 1, 0, 0, 0, 3, 1, 2, 1, 2, 0, 1, 1, 1, 0, 3, 1, 1, 2, 2, 3, 1, 0, 1, 0, 2, 0, 0, 0, 1, 3, 3, 2, 3, 0, 1, 1, 3, 0, 0, 1, 1, 2, 0, 1, 0, 3, 3, 1, 1, 3, 1, 3, 0, 0, 3, 3, 2, 3, 0, 0, 0, 3, 0, 3, 2, 1, 1, 2, 1, 0, 2, 1, 1, 0, 0, 1, 1, 3, 2, 1, 0, 1, 2, 3, 2, 3, 0, 2, 1, 3, 1, 1, 0, 0, 3, 1, 1, 3, 0, 2, 1, 3, 3, 3, 3, 0, 0, 2, 2, 1, 0, 3, 1, 2, 1, 2, 1, 0, 0, 1, 3, 2, 0, 3, 1, 3, 0, 0, 3, 1, 3, 1, 2, 2, 2, 1, 2, 2, 0, 0, 0, 2, 3, 3, 3, 1, 1, 1], "cluster_labels": {"0": "Developed Nations", "1": "Least Developed", "2": "Emerging Economies", "3": "Developing Nations"}, "embeddings": {"PCA": {"x": [-27.62059498500014, 10.592739719297192, 0.7530477536610813, -27.277031317288646, 11.139114274604214, 11.780717588688223, 8.884676133961023, 20.61824261045703, 26.581071620861323, 0.8526259685364466, 12.971437027521569, -15.711891094500837, 12.637197128001382, 17.329935053008587, 24.029811764996087, 4.603507144149514, -24.703134015578176, 11.606063157573889, -10.698407239926315, 4.742834289112511, 15.013473102980859, -23.692360558865413, -18.79438790604409, -23.37610039870474, 21.421180141693068, -3.973365955661046, -33.388554100008164, -32.52655440153201, 11.593044382105614, 4.46870122859857, 3.511466324910815, -21.470217647607843, 10.095173002826986, -19.801847849310494, 17.530638623963863, 12.168325187182866, 18.085676606590468, 20.038353506372953, 25.947255718743254, -18.2837216031018, -2.1161089800963233, 1.862300474743997, -0.45155649469268744, -0.5479060249710485, 19.533354184578002, -16.873797822515698, -27.512211452930032, -2.152426191938838, 25.43032542119126, 23.61259055137114, -14.398867692897548, -19.512779496940425, 7.410397819612435, 25.221372108482964, -20.529686643127206, 23.823017009402648, 6.21563558731997, -6.421762795821559, -29.51995011405012, -29.510342577860147, -4.40087564194708, -21.066201499004233, -4.316334489723396, 18.394614735281934, 25.747987483089837, -13.259491831889507, -10.645160516806186, 4.501417947461427, -4.528669313798799, 22.115414374154327, 19.06645954864844, 25.160213709340493, 5.373711683690199, 20.43842778384314, 3.716429162527908, 8.211212563827438, -19.22553626102991, -11.932003773146347, 9.869745907583702, -18.200781962447607, 17.221088898067297, 9.457526335362358, -27.32278651375513, -28.934035501168403, 17.153706119007044, 29.15594825756331, -22.951373584487023, -25.079975130560374, 5.607847919722412, 3.715149059620884, -27.263345989469904, 18.63944603631204, -19.827577283251774, 6.806764367539895, 4.0115869483262285, 7.021353221449184, -7.077541050047166, 17.967411774611538, -2.683900504400288, -31.100569113016302, -15.113856990789067, -15.241189953601431, -15.909977182061365, 24.519828282991856, 20.630562420837517, -5.924490306519279, -29.170130683353115, -30.298011047593352, -1.93094822093819, 26.16004755593092, 3.890480410963164, -17.344867625677196, 3.033887839464339, -0.5927797653598819, -1.82901635038112, -7.637895223999596, 16.85270615022945, 22.461719474806987, 12.78851227481497, 12.536256690907003, -22.506506484066552, 7.559859760503994, 2.163564565586006, -12.710140147448158, 4.934978020488776, -16.57636907278143, 14.013714830383208, -36.52011214494155, 15.824198217264263, 19.70691058401421, -10.93254375496832, -7.115607481870984, 14.740830217071624, 22.465666463783535, 1.3460108261986763, -13.223024685143479, 0.6194716164675174, 25.424435977442116, 26.83951156042771, -6.445686148073517, -22.269050949121517, 4.986813549986175, -20.246730073259467, 4.995813995069986, 3.688242905495516, 9.757657914525181, -22.30417406388764, 12.300123423011458, 8.057548323262841, 21.27555120067762, 20.119126917243857, 11.344118353659324, 2.6701394362113624, -6.991473669524833, 1.2762926761074913, -4.915911202092605, -16.795674301763356, -22.206632586140028, -17.008823053683624], "y": [1.0518950065476855, -14.082909514803582, -9.90760127777017, 9.523920596793756, 4.140028476833624, 1.756724220781214, -13.687966622657717, 9.836138568141129, 11.984692058047115, -11.340516666157606, 2.188688453235155, -12.555077876690794, 5.136856724394625, -1.640074391475225, 10.561352997968203, -1.760969312576198, 7.13630980404316, -13.72457396901553, 3.4097431559147466, -4.507842734080502, -0.1230064217867763, 4.131735302857847, -9.60300676639047, 7.532292395015406, 9.841925331818937, -5.815099773467165, 17.600837733834908, 14.297638673222796, -5.8565451486346145, -21.83913078774354, -3.746200712117958, 8.374987230987067, -2.442023253574878, 6.38191555031735, 0.2047682703659039, -4.435807361298372, 0.03748675638439255, 4.159099041212914, 15.18331747990225, -2.734283761690602, -0.6944711754964888, -1.969930973914863, -17.081246888250416, -8.917741172365792, -0.09999606567074308, 4.127822502998028, 2.132696894586804, -1.0223310116506652, 10.662215487108195, 12.035710257947752, 7.116025455526758, 3.4219130293014866, -6.505228767593461, 13.603361712843233, 3.7482298411459256, 2.9490409231114563, 4.8595609378825495, -6.621435928749484, 6.864374548545713, 6.674021392256512, -7.687209286677383, 4.39441245446063, -5.936796243959106, 3.6518426769871577, 10.70574310046184, -9.69677095818597, -10.441093941456554, -14.386245044138226, -5.634316743249109, 8.649006351795379, -0.10669154005310347, 5.23856112479933, -0.3610854600345723, 4.637485514335833, -7.894201929256617, -7.416215659074494, 2.90626663952077, 3.3055710237318965, -7.51936404262476, -10.063991475177168, -0.8511307344257167, -7.895089954600178, 5.672329321162147, 8.803862734125916, -2.881939018741318, 15.494956740750295, 3.377969085507785, 0.5587919083842785, -4.697418957287899, -11.654807828821689, 4.4083155815454775, 2.1670258270720644, 4.694872132684773, -5.795799517757265, -6.248106630379408, -3.724431618325247, -2.6090918070099165, -4.185013972087475, -14.735123110462101, 7.7196771184573505, -8.31076763611431, 3.471920526142581, -8.988535065797459, 12.379170605129993, 8.095736319119876, -6.698546799862351, 3.0344154991975247, 12.317431015398812, -5.918351325928815, 11.90547398049662, -11.725398420696205, -1.2286476764616119, 0.18152944830801432, -0.21507114049105527, -7.303726595225378, -4.11337023900471, -2.9043250767752897, 3.385172672701959, -5.043687141387878, -2.8145974205528486, 2.3576532676408606, 7.8162878170037695, 2.5199720938726764, 1.644005439217888, -10.946813192444635, 0.5624888165450932, -2.3571816798321845, 13.317938067458602, 1.3823057630827833, 0.5657612698266019, 1.460400813087078, -0.6219292384210928, -12.332896363478264, 6.770663307671383, -9.018639102295174, 5.323907128387986, -3.467662758449734, 14.139994855662966, 15.456946100934315, -4.552450726350122, 3.858039023255995, -10.299712139675284, 3.707147474753767, -2.5685762418419635, -9.620381889292167, -12.526441945559169, 7.997974364917633, -1.3081416436407685, -1.643533409983117, 11.164308216097748, 12.494175781613082, 1.8068053938979265, -8.09135327023081, 3.6048332232576477, -0.7838813231921243, -14.600438318115671, -3.713327704447787, 3.3220059894696865, 3.756858873148447]}, "t-SNE": {"x": [-9.67988109588623, 5.4624552726745605, 2.7071118354797363, -10.518755912780762, 2.1211225986480713, 4.388515472412109, 6.113856315612793, 6.909683704376221, 8.198691368103027, 4.303776264190674, 2.405430316925049, -4.978764057159424, 3.0162453651428223, 9.70377254486084, 7.571288585662842, 2.439969062805176, -10.0107421875, 7.049246311187744, -6.043187618255615, 0.7274525165557861, 7.330296039581299, -10.175712585449219, -5.845556259155273, -9.702593803405762, 6.5770745277404785, -1.0154986381530762, -11.388908386230469, -11.64315128326416, 3.7429420948028564, -2.4309847354888916, 1.1314971446990967, -8.760289192199707, 1.9087198972702026, -9.520356178283691, 6.630642414093018, 4.364389896392822, 5.186572074890137, 7.579051971435547, 8.626544952392578, -6.6003737449646, -1.535014033317566, -0.3546498417854309, 3.6040494441986084, 0.28515899181365967, 10.080961227416992, -5.640725135803223, -11.881325721740723, -1.2669711112976074, 8.866846084594727, 7.244828224182129, -10.431732177734375, -9.03288745880127, 6.71968936920166, 8.055903434753418, -11.42518138885498, 6.265057563781738, 1.9876571893692017, -0.024391811341047287, -12.742690086364746, -11.241476058959961, -1.9001491069793701, -8.799617767333984, -0.20997636020183563, 7.451107978820801, 9.152716636657715, -4.112751007080078, -4.344799041748047, 3.715946674346924, -7.122235298156738, 9.143573760986328, 5.6609673500061035, 6.528146266937256, 1.7896009683609009, 8.061214447021484, 2.9229512214660645, 8.587662696838379, -7.880163669586182, -4.916762828826904, 0.7943767309188843, -4.939217567443848, 9.450380325317383, 5.348816871643066, -5.927152156829834, -10.962194442749023, 9.466867446899414, 8.986863136291504, -8.91049575805664, -9.426562309265137, 0.2777436673641205, -1.498258113861084, -10.646474838256836, 4.961763381958008, -9.58142375946045, 0.7457888126373291, 0.537207841873169, 5.97318172454834, -3.7233476638793945, 6.059213161468506, 2.3040130138397217, -10.38583755493164, -4.226349353790283, -6.222041130065918, -5.3153486251831055, 7.589687824249268, 6.867583274841309, -1.4374369382858276, -10.950688362121582, -12.475069046020508, -3.239898443222046, 8.86466121673584, 3.5974314212799072, -8.501524925231934, -0.038365527987480164, 0.0028893945273011923, -0.865388035774231, -3.495652437210083, 8.657885551452637, 7.1343183517456055, 6.865504264831543, 7.945276737213135, -9.77231216430664, 1.9538136720657349, -3.5437402725219727, -7.528247833251953, 3.7672922611236572, -8.643393516540527, 6.522366523742676, -12.535285949707031, 7.128486633300781, 6.839870452880859, -4.567132949829102, -5.104387283325195, 0.105309396982193, 6.868306636810303, -0.5229949951171875, -8.246920585632324, 0.11063770204782486, 8.09581184387207, 7.588316440582275, 3.6686859130859375, -8.0194730758667, -0.3811088800430298, -9.004297256469727, 1.0554604530334473, 3.291017770767212, 4.20741605758667, -8.918935775756836, 8.430068969726562, 4.5562424659729, 7.596989631652832, 6.522058486938477, 4.471418380737305, 4.126112461090088, -4.435854434967041, 0.8103766441345215, -2.870682716369629, -8.6251802444458, -7.788021564483643, -7.36338472366333], "y": [-0.45364534854888916, 0.990699291229248, 3.1035451889038086, 3.710733413696289, -4.271355628967285, -2.324322462081909, 1.1944996118545532, -5.813818454742432, -5.319468975067139, 1.5363081693649292, -2.2434656620025635, 3.9916985034942627, -3.137848138809204, -0.7917569875717163, -5.117668151855469, -0.9324330687522888, 2.5311779975891113, 0.7781851291656494, 0.20864497125148773, 0.3623840808868408, -1.5443589687347412, 1.7205675840377808, 4.60011100769043, 2.3334784507751465, -6.177953720092773, 1.4777497053146362, 3.780505657196045, 2.6260993480682373, -1.6623722314834595, 4.96299409866333, 1.0175200700759888, 3.208794355392456, 0.039859838783741, 2.2011091709136963, -2.6205692291259766, -1.1453258991241455, -3.5102741718292236, -2.779470205307007, -6.417612552642822, 3.116487741470337, -0.24200491607189178, 0.09535261243581772, 3.368487596511841, 1.863472819328308, -2.3322198390960693, 1.0567744970321655, 0.9693217873573303, -2.977259874343872, -6.123186111450195, -5.46856689453125, 0.41321897506713867, 1.1983261108398438, -0.2274896502494812, -5.588030815124512, -0.4533480405807495, -4.299988746643066, -3.534101963043213, 1.8250315189361572, 2.8463821411132812, 2.9347496032714844, 2.6990654468536377, 2.1296160221099854, 1.6736479997634888, -2.409430503845215, -6.927262306213379, 5.106509208679199, 3.488271713256836, 3.0639021396636963, -2.5033082962036133, -5.736675262451172, -4.435032844543457, -4.622937202453613, -1.13486647605896, -4.216457366943359, 2.437913179397583, 0.7392550110816956, 1.8612059354782104, -1.807573676109314, -2.3531689643859863, 4.385881423950195, -1.7020686864852905, 3.212528705596924, 1.6810916662216187, 2.8339056968688965, -1.8493034839630127, -7.80881929397583, 2.326349973678589, 3.4049072265625, -1.0785151720046997, -1.4192999601364136, 1.781912088394165, -5.84641695022583, 0.9697156548500061, -1.3924064636230469, 1.2611360549926758, -0.14389429986476898, -0.72109454870224, -1.7570300102233887, 3.682558298110962, 3.410888910293579, 3.808612108230591, 0.6838122606277466, 3.936910629272461, -6.780250072479248, -5.781815528869629, 1.4483013153076172, 1.6366026401519775, 2.8753700256347656, 0.8738707900047302, -6.920998573303223, 5.102436542510986, 0.37116482853889465, -0.05237651243805885, 0.5137942433357239, 0.22902239859104156, 0.8426285982131958, -1.8203078508377075, -3.833420753479004, -0.9141155481338501, -0.8395197987556458, 5.257037162780762, -3.5181171894073486, -2.552685499191284, 0.7488463521003723, 4.759139060974121, 1.251807689666748, -1.6630749702453613, 3.210394859313965, -2.340106964111328, -2.993985891342163, -2.1102640628814697, 0.9868399500846863, -2.688269853591919, -4.4444451332092285, -0.7267236113548279, -0.7459561824798584, -0.36731019616127014, -6.275981903076172, -6.83903169631958, 1.3351956605911255, 3.376774311065674, -1.336354374885559, 2.0921177864074707, -0.7576907277107239, 2.922398805618286, 2.9951536655426025, 4.52386474609375, -0.6018149852752686, 4.947514057159424, -6.020571231842041, -7.087860107421875, -2.3132224082946777, 1.4596134424209595, -2.1203813552856445, -0.15367721021175385, 3.803307294845581, 0.00926810223609209, 2.061187505722046, 1.7416353225708008]}, "UMAP": {"x": [10.655437469482422, 14.549939155578613, 13.822370529174805, 10.037797927856445, 15.211077690124512, 15.19454574584961, 14.501176834106445, 16.70286750793457, 16.724342346191406, 13.843202590942383, 15.005085945129395, 12.208720207214355, 14.875523567199707, 15.88690185546875, 17.005306243896484, 14.471909523010254, 10.275508880615234, 14.912670135498047, 11.808300018310547, 13.969929695129395, 15.331063270568848, 10.64107894897461, 11.835082054138184, 10.705866813659668, 16.88251304626465, 13.417655944824219, 10.127190589904785, 10.325227737426758, 14.476046562194824, 13.117525100708008, 14.030985832214355, 10.556568145751953, 14.226700782775879, 10.434857368469238, 15.56215763092041, 14.942874908447266, 16.108808517456055, 15.925745010375977, 16.915298461914062, 11.404823303222656, 14.29812240600586, 13.866141319274902, 13.759428024291992, 13.913219451904297, 15.684330940246582, 11.327569007873535, 10.70733642578125, 13.197166442871094, 16.58234214782715, 17.011213302612305, 10.805240631103516, 10.786415100097656, 15.065553665161133, 16.851411819458008, 10.62740707397461, 16.402164459228516, 14.82429027557373, 13.574722290039062, 10.259232521057129, 10.130229949951172, 13.26913070678711, 11.021690368652344, 13.885055541992188, 15.582056999206543, 17.3668155670166, 11.861802101135254, 12.646842956542969, 13.959601402282715, 13.365913391113281, 17.099979400634766, 16.269458770751953, 16.679792404174805, 14.457549095153809, 16.986591339111328, 14.0293607711792, 14.829174041748047, 11.310229301452637, 12.64921760559082, 13.969573974609375, 12.148478507995605, 15.26097583770752, 14.788588523864746, 11.452226638793945, 9.991257667541504, 15.478204727172852, 17.019489288330078, 10.747771263122559, 10.524097442626953, 14.270413398742676, 13.819477081298828, 10.522026062011719, 16.33967399597168, 11.047653198242188, 14.522296905517578, 14.196422576904297, 14.873000144958496, 12.519429206848145, 15.770417213439941, 13.58236312866211, 9.953669548034668, 11.977341651916504, 11.582103729248047, 11.603802680969238, 17.06718635559082, 16.439167022705078, 13.681349754333496, 10.488292694091797, 9.897305488586426, 13.535722732543945, 17.23526954650879, 13.859681129455566, 11.437969207763672, 14.078566551208496, 14.032674789428711, 13.053075790405273, 12.64281940460205, 15.559433937072754, 16.144359588623047, 15.047208786010742, 15.005959510803223, 10.049352645874023, 14.913812637329102, 14.345141410827637, 12.115551948547363, 13.781816482543945, 11.565917015075684, 15.327291488647461, 10.026145935058594, 15.608996391296387, 15.894750595092773, 12.490812301635742, 12.324395179748535, 14.667372703552246, 16.509061813354492, 13.323203086853027, 11.336321830749512, 13.553933143615723, 17.194530487060547, 17.217233657836914, 12.877291679382324, 10.687426567077637, 13.551338195800781, 11.065788269042969, 14.609249114990234, 14.20024299621582, 14.233166694641113, 10.28322982788086, 15.264785766601562, 14.200642585754395, 16.82608985900879, 16.72031021118164, 15.478137969970703, 13.898192405700684, 12.73516845703125, 14.384488105773926, 12.700531959533691, 11.200551986694336, 11.029009819030762, 11.495819091796875], "y": [7.167675495147705, 9.700594902038574, 9.316701889038086, 7.396548271179199, 8.270254135131836, 9.000909805297852, 9.994498252868652, 10.311406135559082, 10.56619644165039, 9.788500785827637, 8.408544540405273, 7.972686767578125, 8.425108909606934, 10.490372657775879, 10.545048713684082, 8.35811710357666, 7.524231910705566, 9.68073844909668, 6.9899091720581055, 8.422271728515625, 10.066020965576172, 7.258409023284912, 7.801445960998535, 7.335909843444824, 10.155837059020996, 7.807399272918701, 7.257989883422852, 6.816365718841553, 9.087886810302734, 8.556253433227539, 7.926229000091553, 7.911579132080078, 8.104432106018066, 7.697281837463379, 9.720144271850586, 8.896700859069824, 9.558382034301758, 10.319340705871582, 10.737427711486816, 7.342557907104492, 7.755701065063477, 7.949395656585693, 9.189764976501465, 7.924833297729492, 10.477693557739258, 7.017576217651367, 6.8898024559021, 7.539536952972412, 10.76083755493164, 10.245771408081055, 7.7323431968688965, 7.388307571411133, 9.96532917022705, 10.510735511779785, 7.994343280792236, 9.83193588256836, 8.048295021057129, 7.6318817138671875, 7.246191501617432, 6.923069000244141, 8.07529067993164, 7.7061591148376465, 7.453764915466309, 10.223742485046387, 10.553001403808594, 8.210755348205566, 8.060773849487305, 9.37725830078125, 9.195928573608398, 10.839359283447266, 9.876228332519531, 9.969002723693848, 7.961042404174805, 10.038928985595703, 8.991753578186035, 10.316378593444824, 7.839395999908447, 7.30182409286499, 8.697090148925781, 7.989888668060303, 10.511591911315918, 9.222550392150879, 7.218808174133301, 7.085202693939209, 10.261109352111816, 10.847057342529297, 8.131020545959473, 7.608409404754639, 8.56185531616211, 8.409493446350098, 6.860629558563232, 9.579874038696289, 7.328876495361328, 8.50213623046875, 8.391047477722168, 10.011602401733398, 8.545659065246582, 9.671030044555664, 9.505812644958496, 7.372384548187256, 7.844209671020508, 7.197409629821777, 8.056913375854492, 10.56274127960205, 10.227692604064941, 7.695715427398682, 6.929272651672363, 7.028224468231201, 8.319409370422363, 10.67122745513916, 9.019155502319336, 7.768220901489258, 8.178865432739258, 7.528285503387451, 8.14410400390625, 7.647336483001709, 10.119314193725586, 10.141056060791016, 9.804526329040527, 10.364627838134766, 7.658178806304932, 7.996026992797852, 7.3937087059021, 7.478989601135254, 8.928018569946289, 7.5925421714782715, 9.696221351623535, 6.929698467254639, 9.818723678588867, 9.93691349029541, 7.182375907897949, 7.013636589050293, 9.344264030456543, 9.6867036819458, 8.449728965759277, 7.603745460510254, 8.532115936279297, 10.451976776123047, 10.507917404174805, 9.000316619873047, 7.973283767700195, 8.27249813079834, 7.115428924560547, 8.553519248962402, 9.394181251525879, 9.734992027282715, 7.838733673095703, 10.236018180847168, 9.060099601745605, 10.092352867126465, 10.903433799743652, 9.104228973388672, 9.754983901977539, 7.34915018081665, 7.8158674240112305, 8.112247467041016, 7.926248073577881, 7.830470085144043, 6.886925220489502]}, "Isomap": {"x": [45.94216232903102, -19.56941202847275, 0.7393463181764722, 57.5460204006974, -18.168917590619387, -18.841726296586696, -20.492071644221024, -29.121463530806476, -42.52290591960703, -10.844034592380277, -20.214569782402556, 25.819189634028923, -18.988535131741, -47.897897605126225, -40.92236819298378, -13.615534235789108, 52.28739741404898, -22.297195629030192, 22.168424859754168, -7.811892456015733, -37.34275073915737, 44.978338660446006, 29.814709469862528, 51.49213442812916, -38.18163129006226, 8.314177161326542, 61.440556943713176, 56.048549846554856, -17.043585143111756, -9.436668270164208, -8.484184982019558, 38.74137093210098, -14.31554595488823, 39.687988489267724, -37.540592881753305, -18.86825030724477, -23.31805494634528, -34.06244510996749, -43.500613275397825, 32.41208418175476, 2.7837399210444085, 1.1200440955015618, -1.7271073279337548, 2.7013469878620477, -49.99353531391651, 31.15072545762144, 58.361258622363366, 0.9165836879280003, -42.59173714549118, -39.58349165574358, 28.659866592562658, 35.13672883359583, -19.90705277491069, -41.54141443962176, 32.75229416494201, -41.892762248159784, -10.86275499521962, 8.838649324368806, 57.39848776568479, 54.16291150796794, 4.969063106398895, 43.24003940666182, 7.989153890491791, -35.03233271010065, -42.40553227203592, 24.58076345186994, 18.628714043926728, -11.46094269749847, 12.674317578300192, -41.26215310825811, -36.978206590327254, -41.27634229633349, -9.038514179229358, -41.81756108330005, -6.485779236889249, -21.943120060491317, 34.16945124613444, 23.88990000798776, -15.972527872099183, 29.237523717967637, -41.52702284055489, -17.194386917339394, 48.22837301547504, 52.39476623519782, -41.85950363202142, -52.33563705623568, 45.065941929387655, 44.72496443848647, -7.983772563779147, -12.09499352301449, 50.29926145092118, -33.52594294207241, 38.605324049317474, -11.718539718388866, -4.98286596055237, -15.808230892770998, 6.997063174625645, -40.00801531026082, 5.381998374379323, 57.1851511096046, 24.22299627625168, 30.612525998594723, 30.320843466397573, -41.684782369895125, -29.36174629000275, 11.749014744187578, 52.288215161083784, 59.59771685375111, 4.916457984016135, -44.83991609785874, -14.181246426180511, 33.4355980994825, -0.9798044017434437, 3.906234862383746, 4.0325377741377295, 16.479618378791326, -38.144757366551225, -39.80601639670271, -24.95808476167363, -22.575234339984284, 44.052842394721935, -15.719159908372946, -3.178487014611867, 25.12534126175549, -12.345326239521835, 29.40950454985811, -31.338500208634546, 63.16419739142046, -23.758449318313165, -38.341189891871025, 23.146238540871273, 16.7625306949617, -19.585108604003747, -38.05530080648586, -3.825762938013967, 25.325107202582576, 2.1583465863685953, -41.140491569653626, -42.617406745800196, 9.227190406009735, 38.363762331495565, -6.751643109891518, 35.23414470846237, -9.936760085656555, -11.957967967126896, -25.176064298644494, 40.09830455949056, -25.08190549173632, -19.598030400793814, -38.69418589889988, -42.712530225568024, -19.194293755988546, -9.475034740203519, 19.12048882768196, -6.0718609906632475, 6.200825111241614, 31.188666040026572, 43.64193200328891, 31.843635094707572], "y": [6.506889037078348, 24.096393093744418, 12.82488052884882, -7.046510843368854, -17.137068604593964, -4.034699107812767, 28.464681335517433, -19.581867058744994, -12.711020914877276, 27.004818948311204, -14.564046634925212, 15.26840476772174, -16.78279858945457, 10.61060083943278, -9.460001946228623, -8.198795931296965, -7.547144174467344, 20.58310994988823, -6.239300047371081, 7.61053448614391, 10.78739476299969, -2.8310372891022832, 14.95116339596211, -7.1777103579352985, -15.677239485830212, -2.793616902318048, -7.4001435874637504, -6.03065232986661, 6.623987462566286, 44.02809017821635, -6.128955045036393, -23.99682002427372, -13.535900127561526, -2.7635798333066326, 3.4401217967169075, -1.035382749044903, -15.717263171577645, -2.2755178643979153, -16.407947592623817, 4.302429902784174, -12.772996984098942, -6.471578961259031, 29.136474385982755, -2.3612544283936296, 7.757395160943234, -1.0816350396761742, 0.03796636713370062, -3.701841717245547, -12.55541098361037, -16.981356036022476, -10.26423661648873, 0.15308423903302715, 23.177263254034568, -13.209997705407805, -14.336369290835641, -4.628357162361827, -14.872976244571625, -1.1628979934578878, 0.41364163579739543, 0.20378264407312668, 4.184056371678556, -8.30613446846366, -2.584094474498095, -0.3254970035306104, -19.542817026223233, 17.071121127330965, 12.85893754058194, 19.05354701195482, 20.099452849093673, -14.217851816369334, -2.165835934038958, -6.840844060761733, -7.654575673041818, -8.710145850204967, 6.409148723068893, 23.14018576945417, -6.2951998384515, 2.655164436300153, -1.511374088940871, 12.811132873385297, 7.644411480999316, 2.4246516425496365, 3.5298823372460846, -2.9759232545035315, 9.928449950880637, -24.073510250815776, 3.825512373209423, -5.301328648318969, 1.8559186604832352, 7.117525479665116, 0.4597130126321899, -3.8241057900248894, -9.2022152509371, 9.803479975072067, 2.4694317930099663, 13.988324122703247, 1.187171765568469, 11.060579627651165, 28.381477531152193, -5.107755896774582, 14.179595441894831, -0.11040058433104694, 12.291556492586738, -18.26392048964709, -14.852675831698567, 2.248603856047841, -0.25514130205599506, -8.421778182541308, 9.702312184497488, -18.435454956286115, 12.357273941104385, 5.564817774398993, -7.217800105428085, -8.918203757639589, 7.613376652722343, 1.6059066967706097, 8.978928927194145, -1.9965093297640515, 18.204280485984604, 14.67776179189832, -14.797421886413526, -14.36323697533725, -14.443421355813019, -9.51248231612893, 12.7229486394947, -0.5808919383860924, 10.989764147235704, -3.5702521424949056, -4.460812706419943, 4.209232645061819, -8.704910196580824, 7.061074061978344, 13.190978105251867, -8.794826052365385, 11.51922360633261, -10.741483247591507, 6.872460846214309, -17.504078459791035, -20.741106943147024, 8.749189288880778, -19.375608107802943, 7.016263663286801, -7.999610408561891, 6.280335732344231, 18.59723367170981, 24.043894199097156, -28.016830150046204, 13.216406546591296, -0.3163113723329079, -11.888776825756855, -19.818897570177732, -4.604061296458363, 22.803739805001406, -9.137257695312849, -6.399562570149402, 8.55962026343897, 5.498302511855924, -1.374695488732333, -2.9639076594752543]}, "LLE": {"x": [0.11591812793030769, -0.020436311141123, 0.018600142085601387, 0.10591158908477377, -0.046951079150786765, -0.05769958951543619, -0.013022276399092397, -0.11330702687194799, -0.14659548924060783, 0.011559313402561305, -0.05250261045454896, 0.08211362290888792, -0.06245647003458571, -0.07583440701851656, -0.13410264793049914, -0.014502148129722864, 0.10937841754821993, -0.02330217298062308, 0.037440196576568996, -0.020314669535443988, -0.060765440109021074, 0.10650228049894837, 0.08455024431514545, 0.09995159143485975, -0.11126625804752026, 0.01975401043279941, 0.12972338187200227, 0.13993810627517128, -0.03761713148270252, 0.007695578139832043, -0.009515245658476973, 0.08352843476197769, -0.027411589673647194, 0.08702707455676414, -0.07991378548556674, -0.04181295132613455, -0.07425393600615056, -0.09964002239608549, -0.15218240778721615, 0.07669952675289343, 0.013712122825910764, -0.005991875805789623, 0.0269444210325709, 0.01346842148721238, -0.08405331012728665, 0.06344097453666911, 0.1136862676476412, 0.02798439458077549, -0.1391336431012932, -0.12846652255869906, 0.05506452574851153, 0.09221393927397255, -0.022391608501483848, -0.1435949282910347, 0.08346495851340939, -0.10673081585239008, -0.02381719363511099, 0.03481234079182434, 0.12846417264715976, 0.12792947491888068, 0.03299065803351278, 0.08388776748928396, 0.022320249647050358, -0.09048801330343206, -0.13588196335609498, 0.0647489752372676, 0.059580322184887076, 0.003942557806639865, 0.03458400836418428, -0.11714219172566058, -0.08521802811829957, -0.12366375755941035, -0.019030698362137263, -0.10244974366734108, 0.002331664970831017, -0.02920875850830429, 0.07720254268251234, 0.050249579248442366, -0.025260710159282915, 0.09061791855107396, -0.07344045841322895, -0.027379646969070214, 0.09940957558762026, 0.12422612417142079, -0.07114561445867709, -0.16029720673529216, 0.0981711380596541, 0.1071022578820164, -0.006634816451490125, -0.0033910802589906253, 0.12476479196195707, -0.0731405290442445, 0.08646198334935493, -0.009904424131919037, -0.007687637708261017, -0.022449738837757787, 0.02102267150709601, -0.06738756889013015, 0.028492572501884417, 0.12488953968011712, 0.07373012300085671, 0.05226379556407756, 0.07436080150423001, -0.135770213363706, -0.10823491993903085, 0.03351468544957862, 0.12647340525717649, 0.1321767939966782, 0.014903923478708402, -0.14678174869573893, 0.005024668590869662, 0.07835271937988678, -0.01604168454344423, 0.005685949847504625, 0.015477082812602128, 0.03715002461272357, -0.0705776103321813, -0.10839191244332393, -0.05257756160997181, -0.0548811786451777, 0.08409749011311726, -0.03678391602110316, -0.00442682322184533, 0.05207087791176565, -0.003190850357843493, 0.0789557077568375, -0.0566702056463691, 0.15827284123596203, -0.07176287086658185, -0.09239254037393563, 0.050269288250467614, 0.02314030902945957, -0.03853985704317099, -0.11331747083323042, 0.013241666034532633, 0.05804056343450533, 0.008103788742007928, -0.14687868644168017, -0.15495543157793676, 0.03519876669021459, 0.08832159022042078, -0.0005466932802288028, 0.08852009367508232, -0.01413275922377615, 0.004585034911929993, -0.023477836290366774, 0.08660317253246058, -0.05262409854503493, -0.037143860013871086, -0.12381040372932967, -0.12419864309039455, -0.05368193941447033, 0.0021954758580720324, 0.033485737208676064, -0.0023750109577106576, 0.04109512622800493, 0.07564206743532775, 0.08876101983543362, 0.07076573532742372], "y": [-0.05528965009863293, -0.03304541225578281, 0.022031021521861045, -0.015859480911667355, 0.05872033174762961, 0.02174060479037658, -0.11138728442108409, 0.07741761038257278, -0.025120157395551596, -0.09736752662383805, 0.13573902700039114, -0.0284958810098414, 0.038699311955852585, -0.1919155211529009, -0.02190376917350966, 0.14198991135660122, 0.050205492859763265, -0.11869820332706123, -0.046342117433595224, 0.09869473958779942, -0.1672254682434514, 0.027256701538412552, -0.06251088093476567, -0.003187263217363113, 0.08376955370331718, 0.05495181694785325, -0.06867742516169376, 0.014244983560890549, 0.027290920539658394, -0.08891663783891395, 0.1469814615265841, -0.0425898211734676, 0.1250039536381309, 0.0013202156102227226, -0.10903568462018047, 0.012578223211523326, 0.06210705698292457, -0.12345287489830853, 0.0037062665431435923, -0.030998241964751372, 0.11774385756081154, 0.08632615011933382, 0.036460129280446674, 0.17721924580134063, -0.180106137930784, -0.043983769856369204, -0.007467349886664448, 0.018083941110312304, -0.01984934107925465, 0.020283356277116447, -0.050750297804691626, 0.015680384573282143, -0.14129242478372947, -0.037162197255214274, 0.018738897009439117, 0.00021765784669072665, 0.06045430335366944, 0.17864708559537, 0.010530075958331483, -0.04753781076788083, -0.009458015766638996, 0.02497319098133297, 0.1411953759264011, -0.15571500127970617, 0.09172910056347734, -0.02897744425805742, -0.05927963218059988, 0.05155863802073417, 0.017525022499450683, 0.031949514529881096, 0.06581263490664212, 0.002010049520347508, 0.11775364138646782, -0.009635847571862088, 0.07330041079152921, -0.16249686742593658, 0.026360146828608245, -0.11405794971529783, 0.11807916373116725, -0.07801586886264267, -0.1900601584329194, 0.09388035599395159, -0.05840944230986131, 0.008809286047097, -0.17411383847516848, 0.07239804451659365, -0.021863027352287984, 0.015873542621325305, 0.05144908095133238, 0.05480355616474776, 0.007345269751242806, 0.07206387751877597, 0.008677285684015788, -0.008971544866206365, 0.14825865542838762, -0.11550655983688331, -0.12291106897257967, -0.05779996644748046, -0.007928704848848745, -0.013842292176894637, -0.0665441684343692, -0.06263233538762424, -0.03113240912427926, 0.04149008608442029, 0.04717227538143792, 0.09591558917894878, 0.01691423207128801, 0.016445280032115907, -0.0676558413142464, 0.04690751136127023, 0.07757263394031363, -0.02564621726562949, 0.09627268541802936, 0.11643386048519053, 0.06214987670423104, -0.0036113916360203495, -0.14101863582125126, -0.06587802756230751, -0.13946242972369743, -0.157354079257003, 0.014782603073884418, 0.07427837649293333, 0.005315472152887198, 0.03885010404776176, 0.06340138075243751, 0.021469721497566964, -0.11987127614889681, -0.027303316495083448, -0.10388568640387619, -0.08150107102279827, 0.00024813484850883666, -0.04931556295266979, 0.02195868257436797, 0.005318602157199315, 0.00924531303908837, 0.039791901208773184, 0.03551951564463143, 0.03206451279459906, 0.06639688917811137, -0.05735932889144717, 0.006688351311110036, 0.011637782435986718, 0.04051811128468465, 0.04788075588446625, 0.034563107024088546, 0.0059297622611169665, 0.019116025537107256, -0.15769332071745015, 0.14966126927115142, 0.029100064642578354, 0.08899140193156349, 0.005893677068930872, -0.07652155572934281, -0.018949300602522107, 0.13957500981337734, -0.0415135938015946, 0.008651536911568496, -0.03545471556398417, 0.014753896501761092]}}, "variance_explained": {"PC1": 33.9, "PC2": 7.0}, "indicators": {}, "cluster_averages": {}}''')
 
 data = load_data()
 
-df = pd.DataFrame({
-    'Country': data['countries'],
-    'Cluster': data['clusters'],
-    'Cluster_Name': [data['cluster_labels'][str(c)] for c in data['clusters']],
-    'PC1_Score': data['embeddings']['PCA']['x']
-})
+@st.cache_data
+def embedding_arrays(_data):
+    return {m: (np.asarray(e['x'], dtype=np.float32), np.asarray(e['y'], dtype=np.float32)) for m, e in _data['embeddings'].items()}
 
-for m in data['embeddings']:
-    df[f'{m}_x'] = data['embeddings'][m]['x']
-    df[f'{m}_y'] = data['embeddings'][m]['y']
+@st.cache_data
+def build_df(_data):
+    embeddings = embedding_arrays(_data)
+    clusters = np.asarray(_data['clusters'], dtype=np.int8)
+    labels = np.array([_data['cluster_labels'][str(i)] for i in range(len(_data['cluster_labels']))])
+    return pd.DataFrame({
+        'Country': _data['countries'],
+        'Cluster': pd.Categorical.from_codes(clusters, categories=range(len(labels))),
+        'Cluster_Name': pd.Categorical.from_codes(clusters, categories=labels),
+        'PC1_Score': embeddings['PCA'][0],
+        **{f'{m}_{a}': xy[i] for m, xy in embeddings.items() for i, a in enumerate(('x', 'y'))},
+        **{name: np.asarray(v, dtype=np.float32) for name, v in _data['indicators'].items()}
+    })
 
-cluster_colors = {0: '#E63946', 1: '#2A9D8F', 2: '#E9C46A', 3: '#6A4C93'}
-cluster_color_map = {'Developed Nations': '#E63946', 'Least Developed': '#2A9D8F', 'Emerging Economies': '#E9C46A', 'Developing Nations': '#6A4C93'}
+@st.cache_data
+def country_index(_data):
+    return {c: i for i, c in enumerate(_data['countries'])}
 
-with st.sidebar:
-    st.markdown("## 🎛️ Controls")
-    methods = list(data['embeddings'].keys())
-    method = st.radio("**Projection Method**", methods)
-    st.markdown("---")
-    color_by = st.radio("**Color By**", ["Cluster (Discrete)", "PC1 Score (Continuous)"])
-    st.markdown("---")
-    selected_country = st.selectbox("**🔍 Find Country**", [""] + sorted(data['countries']))
-    st.markdown("---")
-    st.markdown("**Filter Clusters**")
-    show_clusters = {int(i): st.checkbox(name, value=True, key=f"c{i}") for i, name in data['cluster_labels'].items()}
-    st.markdown("---")
-    st.markdown("<div style='font-size: 0.8rem; color: #888;'><b>Countries:</b> 159<br><b>Features:</b> 875<br><b>Data:</b> WHO, World Bank, UN</div>", unsafe_allow_html=True)
+@st.cache_data
+def sorted_countries(_data):
+    return [""] + sorted(_data['countries'])
 
-st.markdown('<h1 class="main-header">🌍 Global Health Explorer</h1>', unsafe_allow_html=True)
-st.markdown('<p class="sub-header">Dimensionality Reduction Analysis • 159 Countries • 1990-2019</p>', unsafe_allow_html=True)
+@st.cache_data
+def cluster_stats(_df, n_clusters):
+    clusters_arr = _df['Cluster'].cat.codes.to_numpy()
+    counts = np.bincount(clusters_arr, minlength=n_clusters)
+    avg_pc1s = np.bincount(clusters_arr, weights=_df['PC1_Score'], minlength=n_clusters) / np.maximum(counts, 1)
+    return clusters_arr, counts, avg_pc1s
 
-mask = df['Cluster'].isin([c for c, show in show_clusters.items() if show])
-df_filtered = df[mask].copy()
+df = build_df(data)
+country_idx = country_index(data)
+n_clusters = len(data['cluster_labels'])
+clusters_arr, counts, avg_pc1s = cluster_stats(df, n_clusters)
 
-col1, col2 = st.columns([2, 1])
+cluster_colors = {0: '#E63946', 1: '#2A9D8F', 2: '#E9C46A', 3: '#6A4C93'}
 
-with col1:
-    st.markdown(f"### {method} Projection")
+@st.cache_data
+def cluster_groups(_df, method, active):
+    codes = _df['Cluster'].cat.codes.to_numpy()
+    xs, ys = _df[f'{method}_x'].to_numpy(), _df[f'{method}_y'].to_numpy()
+    countries, pc1 = _df['Country'].to_numpy(), _df['PC1_Score'].to_numpy()
+    groups = []
+    # Keep px's ordering: clusters in order of first appearance
+    for cid in pd.unique(codes).tolist():
+        if cid not in active:
+            continue
+        sel = codes == cid
+        groups.append((cid, _df['Cluster_Name'].cat.categories[cid], xs[sel], ys[sel], countries[sel], pc1[sel]))
+    return groups
+
+def cluster_figure(method, active):
+    fig = go.Figure()
+    for cid, name, xs, ys, countries, pc1 in cluster_groups(df, method, active):
+        fig.add_trace(go.Scattergl(x=xs, y=ys, mode='markers', name=name, marker_color=cluster_colors[cid],
+            hovertext=countries, customdata=pc1, hovertemplate=f'<b>%{{hovertext}}</b><br><br>Cluster_Name={name}<br>PC1_Score=%{{customdata:.2f}}<extra></extra>'))
+    fig.update_layout(legend_title_text='Cluster_Name')
+    return fig
+
+@st.cache_data
+def cluster_cards(_data, n_clusters, counts, avg_pc1s):
+    cards = {}
+    for cid in range(n_clusters):
+        name = _data['cluster_labels'][str(cid)]
+        count = counts[cid]
+        color = cluster_colors[cid]
+        avg_pc1 = avg_pc1s[cid]
+        cards[cid] = f"<div class='metric-card'><span class='cluster-badge cluster-{cid}'>{name}</span><span style='color:#888;float:right;'>{count} countries</span><div style='margin-top:0.5rem;font-size:0.9rem;'><span style='color:#888;'>Avg PC1:</span> <span style='color:{color}'>{avg_pc1:.1f}</span></div></div>"
+    return cards
+
+@st.cache_resource
+def make_base_fig(_df_filtered, method, color_by, active):
     x_col, y_col = f'{method}_x', f'{method}_y'
     
     if color_by == "Cluster (Discrete)":
-        fig = px.scatter(df_filtered, x=x_col, y=y_col, color='Cluster_Name', 
-            color_discrete_map=cluster_color_map, hover_name='Country', 
-            hover_data={x_col: False, y_col: False, 'PC1_Score': ':.2f'})
+        fig = cluster_figure(method, active)
     else:
-        fig = px.scatter(df_filtered, x=x_col, y=y_col, color='PC1_Score',
+        df_plot = _df_filtered[['Country', 'PC1_Score', x_col, y_col]]
+        fig = px.scatter(df_plot, x=x_col, y=y_col, color='PC1_Score',
             color_continuous_scale='viridis', hover_name='Country',
             hover_data={x_col: False, y_col: False, 'PC1_Score': ':.2f'},
-            labels={'PC1_Score': 'PC1 Score (Development Level)'})
-    
-    if selected_country:
-        cd = df[df['Country'] == selected_country]
-        if len(cd) > 0:
-            fig.add_trace(go.Scatter(x=cd[x_col], y=cd[y_col], mode='markers+text', 
-                marker=dict(size=20, color='white', line=dict(width=3, color='#ff6b6b')), 
-                text=[selected_country], textposition='top center', 
-                textfont=dict(size=14, color='white'), showlegend=False))
+            labels={'PC1_Score': 'PC1 Score (Development Level)'}, render_mode='webgl')
     
     fig.update_traces(marker=dict(size=10, line=dict(width=1, color='rgba(0,0,0,0.3)')))
     x_label, y_label = f"{method} Dim 1", f"{method} Dim 2"
@@ -119,23 +163,78 @@ with col1:
             ticktext=["Less Dev.", "", "Mid", "", "More Dev."]
         ))
     
+    return fig
+
+def add_highlight(fig, method, country):
+    # Copy so the cached base figure is left untouched
+    fig = go.Figure(fig)
+    idx = country_idx[country]
+    fig.add_trace(go.Scattergl(x=[df[f'{method}_x'].iat[idx]], y=[df[f'{method}_y'].iat[idx]], mode='markers+text', 
+        marker=dict(size=20, color='white', line=dict(width=3, color='#ff6b6b')), 
+        text=[country], textposition='top center', 
+        textfont=dict(size=14, color='white'), showlegend=False))
+    return fig
+
+@st.cache_resource
+def make_method_fig(_df_filtered, method, color_by, active):
+    if color_by == "PC1 Score (Continuous)":
+        df_plot = _df_filtered[['Country', 'PC1_Score', f'{method}_x', f'{method}_y']]
+        fig_s = px.scatter(df_plot, x=f'{method}_x', y=f'{method}_y', color='PC1_Score',
+            color_continuous_scale='viridis', hover_name='Country', title=method, render_mode='webgl')
+    else:
+        fig_s = cluster_figure(method, active)
+        fig_s.update_layout(title=method)
+    fig_s.update_traces(marker=dict(size=5))
+    fig_s.update_layout(showlegend=False, plot_bgcolor='rgba(0,0,0,0)', 
+        paper_bgcolor='rgba(0,0,0,0)', font=dict(color='#e8e8e8', size=9), 
+        xaxis=dict(showticklabels=False, title='', constrain='domain'), 
+        yaxis=dict(showticklabels=False, title='', scaleanchor='x', scaleratio=1), 
+        coloraxis_showscale=False,
+        height=200, margin=dict(l=5, r=5, t=25, b=5))
+    return fig_s
+
+cards = cluster_cards(data, n_clusters, counts, avg_pc1s)
+
+with st.sidebar:
+    st.markdown("## 🎛️ Controls")
+    methods = list(data['embeddings'].keys())
+    method = st.radio("**Projection Method**", methods)
+    st.markdown("---")
+    color_by = st.radio("**Color By**", ["Cluster (Discrete)", "PC1 Score (Continuous)"])
+    st.markdown("---")
+    selected_country = st.selectbox("**🔍 Find Country**", sorted_countries(data))
+    st.markdown("---")
+    st.markdown("**Filter Clusters**")
+    show_clusters = {int(i): st.checkbox(name, value=True, key=f"c{i}") for i, name in data['cluster_labels'].items()}
+    st.markdown("---")
+    st.markdown("<div style='font-size: 0.8rem; color: #888;'><b>Countries:</b> 159<br><b>Features:</b> 875<br><b>Data:</b> WHO, World Bank, UN</div>", unsafe_allow_html=True)
+
+st.markdown('<h1 class="main-header">🌍 Global Health Explorer</h1>', unsafe_allow_html=True)
+st.markdown('<p class="sub-header">Dimensionality Reduction Analysis • 159 Countries • 1990-2019</p>', unsafe_allow_html=True)
+
+active_clusters = tuple(c for c, show in show_clusters.items() if show)
+mask = np.isin(clusters_arr, np.fromiter(active_clusters, dtype=np.int8))
+df_filtered = df.iloc[mask]
+
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    st.markdown(f"### {method} Projection")
+    fig = make_base_fig(df_filtered, method, color_by, active_clusters)
+    if selected_country:
+        fig = add_highlight(fig, method, selected_country)
     st.plotly_chart(fig, use_container_width=True)
 
 with col2:
     st.markdown("### Cluster Profiles")
-    for cid in range(4):
-        if show_clusters.get(cid, True):
-            name = data['cluster_labels'][str(cid)]
-            count = sum(1 for c in data['clusters'] if c == cid)
-            color = cluster_colors[cid]
-            cluster_pc1 = [df['PC1_Score'].iloc[i] for i, c in enumerate(data['clusters']) if c == cid]
-            avg_pc1 = sum(cluster_pc1) / len(cluster_pc1) if cluster_pc1 else 0
-            st.markdown(f"<div class='metric-card'><span class='cluster-badge cluster-{cid}'>{name}</span><span style='color:#888;float:right;'>{count} countries</span><div style='margin-top:0.5rem;font-size:0.9rem;'><span style='color:#888;'>Avg PC1:</span> <span style='color:{color}'>{avg_pc1:.1f}</span></div></div>", unsafe_allow_html=True)
+    parts = [cards[cid] for cid in range(n_clusters) if show_clusters.get(cid, True)]
+    if parts:
+        st.markdown("".join(parts), unsafe_allow_html=True)
 
 if selected_country:
     st.markdown("---")
     st.markdown(f"### 📍 {selected_country}")
-    idx = data['countries'].index(selected_country)
+    idx = country_idx[selected_country]
     cid = data['clusters'][idx]
     pc1 = data['embeddings']['PCA']['x'][idx]
     cols = st.columns(3)
@@ -144,27 +243,17 @@ if selected_country:
     cols[2].metric("Development", "High" if pc1 > 10 else "Medium" if pc1 > -10 else "Low")
 
 st.markdown("---")
-st.markdown("### 🔬 Method Comparison")
-mcols = st.columns(5)
 descs = {'PCA': 'Linear, global', 't-SNE': 'Local structure', 'UMAP': 'Local+global', 'Isomap': 'Geodesic', 'LLE': 'Local linear'}
-for col, m in zip(mcols, data['embeddings'].keys()):
-    with col:
-        if color_by == "PC1 Score (Continuous)":
-            fig_s = px.scatter(df_filtered, x=f'{m}_x', y=f'{m}_y', color='PC1_Score',
-                color_continuous_scale='viridis', hover_name='Country', title=m)
-        else:
-            fig_s = px.scatter(df_filtered, x=f'{m}_x', y=f'{m}_y', color='Cluster',
-                color_discrete_sequence=['#E63946', '#2A9D8F', '#E9C46A', '#6A4C93'], 
-                hover_name='Country', title=m)
-        fig_s.update_traces(marker=dict(size=5))
-        fig_s.update_layout(showlegend=False, plot_bgcolor='rgba(0,0,0,0)', 
-            paper_bgcolor='rgba(0,0,0,0)', font=dict(color='#e8e8e8', size=9), 
-            xaxis=dict(showticklabels=False, title='', constrain='domain'), 
-            yaxis=dict(showticklabels=False, title='', scaleanchor='x', scaleratio=1), 
-            coloraxis_showscale=False,
-            height=200, margin=dict(l=5, r=5, t=25, b=5))
-        st.plotly_chart(fig_s, use_container_width=True)
-        st.caption(descs.get(m, ''))
+comparison = st.expander("**🔬 Method Comparison**", key="comparison", on_change="rerun")
+with comparison:
+    # Only build and send the subplots while the expander is open
+    if comparison.open:
+        mcols = st.columns(5)
+        for col, m in zip(mcols, data['embeddings'].keys()):
+            with col:
+                fig_s = make_method_fig(df_filtered, m, color_by, active_clusters)
+                st.plotly_chart(fig_s, use_container_width=True)
+                st.caption(descs.get(m, ''))
 
 st.markdown("---")
 st.caption("Assessment 3 • Data Analytics & Visualisation (RAI-7002) • Data: WHO, World Bank, UN (1990-2019)")